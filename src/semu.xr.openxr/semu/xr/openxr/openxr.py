@@ -1,10 +1,12 @@
 from typing import Union, Callable
 
 import os
-import sys
+import math
 import ctypes
+import functools
+import concurrent.futures
+import importlib.util
 
-import cv2
 import numpy
 import numpy as np
 
@@ -54,6 +56,29 @@ XR_ACTION_TYPE_VECTOR2F_INPUT = 3
 XR_ACTION_TYPE_POSE_INPUT = 4
 XR_ACTION_TYPE_VIBRATION_OUTPUT = 100
 
+# action type by the last segment of the action path
+_SUFFIX_TO_TYPE = {"click": XR_ACTION_TYPE_BOOLEAN_INPUT,
+                   "touch": XR_ACTION_TYPE_BOOLEAN_INPUT,
+                   "value": XR_ACTION_TYPE_FLOAT_INPUT,
+                   "force": XR_ACTION_TYPE_FLOAT_INPUT,
+                   "x": XR_ACTION_TYPE_VECTOR2F_INPUT,
+                   "y": XR_ACTION_TYPE_VECTOR2F_INPUT,
+                   "pose": XR_ACTION_TYPE_POSE_INPUT,
+                   "haptic": XR_ACTION_TYPE_VIBRATION_OUTPUT,
+                   "haptic_left": XR_ACTION_TYPE_VIBRATION_OUTPUT,
+                   "haptic_right": XR_ACTION_TYPE_VIBRATION_OUTPUT,
+                   "haptic_left_trigger": XR_ACTION_TYPE_VIBRATION_OUTPUT,
+                   "haptic_right_trigger": XR_ACTION_TYPE_VIBRATION_OUTPUT}
+
+# OpenXR (+Y up, -Z forward) to stage (+Z up) position transformation: (x, y, z) -> (x, -z, y)
+_POSITION_TRANSFORM = np.array([[1, 0, 0], [0, 0, -1], [0, 1, 0]], dtype=np.float64)
+
+# number of pose actions from which the poses are converted in batch (NumPy), below it the per-pose (scalar) conversion is faster
+_BATCH_POSE_THRESHOLD = 8
+
+# flipped image axes to OpenCV flip code: around the x-axis (0), the y-axis (1) or both axes (-1)
+_FLIP_CODES = {(0,): 0, (1,): 1, (0, 1): -1}
+
 XR_NO_DURATION = 0
 XR_INFINITE_DURATION = 2**32
 XR_MIN_HAPTIC_DURATION = -1
@@ -99,6 +124,7 @@ class XrViewConfigurationView(ctypes.Structure):
 class ActionState(ctypes.Structure):
     _fields_ = [('type', XrActionType),
                 ('path', ctypes.c_char_p),
+                ('index', ctypes.c_int),
                 ('isActive', ctypes.c_bool),
                 ('stateBool', ctypes.c_bool), 
                 ('stateFloat', ctypes.c_float), 
@@ -108,9 +134,72 @@ class ActionState(ctypes.Structure):
 class ActionPoseState(ctypes.Structure):
     _fields_ = [('type', XrActionType),
                 ('path', ctypes.c_char_p),
+                ('index', ctypes.c_int),
                 ('isActive', ctypes.c_bool),
                 ('pose', XrPosef)]
 
+# value extractors, by action type, for the action states that invoke their callback during action polling
+_ACTION_STATE_EXTRACTORS = {XR_ACTION_TYPE_BOOLEAN_INPUT: lambda state: state.stateBool,
+                            XR_ACTION_TYPE_FLOAT_INPUT: lambda state: state.stateFloat,
+                            XR_ACTION_TYPE_VECTOR2F_INPUT: lambda state: (state.stateVectorX, state.stateVectorY)}
+_ACTION_STATE_DICT_EXTRACTORS = {XR_ACTION_TYPE_BOOLEAN_INPUT: lambda state: state["stateBool"],
+                                 XR_ACTION_TYPE_FLOAT_INPUT: lambda state: state["stateFloat"],
+                                 XR_ACTION_TYPE_VECTOR2F_INPUT: lambda state: (state["stateVectorX"], state["stateVectorY"])}
+
+# structured dtypes (numpy) mirroring the XrPosef and ActionPoseState memory layouts (the path is read as a raw pointer)
+_POSE_DTYPE = np.dtype({"names": ["ox", "oy", "oz", "ow", "px", "py", "pz"],
+                        "formats": [np.float32] * 7,
+                        "offsets": [XrPosef.orientation.offset + getattr(XrQuaternionf, axis).offset for axis in "xyzw"] \
+                                 + [XrPosef.position.offset + getattr(XrVector3f, axis).offset for axis in "xyz"],
+                        "itemsize": ctypes.sizeof(XrPosef)})
+_APSTATE_DTYPE = np.dtype({"names": ["type", "path", "index", "isActive", "pose"],
+                           "formats": [np.int32, np.uintp, np.int32, np.bool_, _POSE_DTYPE],
+                           "offsets": [ActionPoseState.type.offset, ActionPoseState.path.offset, ActionPoseState.index.offset, ActionPoseState.isActive.offset, ActionPoseState.pose.offset],
+                           "itemsize": ctypes.sizeof(ActionPoseState)})
+
+# C function pointer type of the render callback: void (*)(int, XrView *, XrViewConfigurationView *)
+_RENDER_CALLBACK_TYPE = ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.POINTER(XrView), ctypes.POINTER(XrViewConfigurationView))
+
+
+def _pose_remap(in_buf, out_buf, meters_per_unit):
+    # in_buf rows: position (x, y, z) and orientation (w, x, y, z) in the OpenXR coordinate system
+    # out_buf rows: position (x, y, z) in stage unit and orientation (w, x, y, z)
+    for i in range(in_buf.shape[0]):
+        out_buf[i, 0] = in_buf[i, 0] / meters_per_unit
+        out_buf[i, 1] = -in_buf[i, 2] / meters_per_unit
+        out_buf[i, 2] = in_buf[i, 1] / meters_per_unit
+        for j in range(3, 7):
+            out_buf[i, j] = in_buf[i, j]
+
+@functools.lru_cache(maxsize=None)
+def _get_pose_remap_jit() -> Union[Callable, None]:
+    # compile the pose remapping lazily (when the first pose action is added) if Numba is available and able to compile it
+    # (e.g. not from the Cython build), otherwise the equivalent NumPy operations are used (the outcome is memoized)
+    try:
+        import numba
+        return numba.njit("void(float32[:, :], float64[:, :], float64)", cache=True, fastmath=True)(_pose_remap)
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=None)
+def _encode(string: str) -> bytes:
+    # UTF-8 encoded string (memoized) to be passed as const char * to the ctypes library
+    return string.encode('utf-8')
+
+@functools.lru_cache(maxsize=None)
+def _encode_array(strings: tuple) -> ctypes.Array:
+    # array of UTF-8 encoded strings (memoized) to be passed as const char ** to the ctypes library
+    array = (ctypes.c_char_p * len(strings))()
+    array[:] = [_encode(string) for string in strings]
+    return array
+
+def _ctypes_function(library, name: str, restype, argtypes: list):
+    # set the prototype of a library function to avoid ctypes' default (int) conversions on each call
+    function = getattr(library, name)
+    function.restype = restype
+    function.argtypes = argtypes
+    return function
+
 
 
 
@@ -131,24 +220,50 @@ class OpenXR:
         self._prim_right = None
         self._frame_left = None
         self._frame_right = None
+        self._frame_left_pointer = None
+        self._frame_right_pointer = None
         self._viewport_window_left = None
         self._viewport_window_right = None
 
         self._meters_per_unit = 1.0
+        self._position_transform = _POSITION_TRANSFORM / self._meters_per_unit
         self._reference_position = Gf.Vec3d(0, 0, 0)
         self._reference_rotation = Gf.Vec3d(0, 0, 0)
         self._rectification_quat_left = Gf.Quatd(1, 0, 0, 0)
         self._rectification_quat_right = Gf.Quatd(1, 0, 0, 0)
 
         self._viewport_interface = None
+        self._recommended_resolutions = None
+        self._xform_op_attributes = {}
+        self._transform_matrix = None
 
         self._transform_fit = None
         self._transform_flip = None
+        self._transform_flip_code = None
+        self._transform_buffers = {}
+        self._transform_executor = None
+
+        # ctypes buffers
+        self._exit_loop = ctypes.c_bool(False)
+        self._exit_loop_ref = ctypes.byref(self._exit_loop)
+        self._n_actions = 0
+        self._n_pose_actions = 0
+        self._action_states = (ActionState * 0)()
+        self._action_pose_states = (ActionPoseState * 0)()
+
+        # pybind11 buffers (one row per pose action: position (x, y, z) and orientation (w, x, y, z))
+        self._action_pose_indexes = []
+        self._action_poses = np.zeros((0, 7), dtype=np.float32)
+        self._action_poses_active = np.zeros((0,), dtype=np.bool_)
+        # views and configuration views (repacked as ctypes structures for the render callback)
+        self._xr_views = (XrView * 2)()
+        self._xr_configuration_views = (XrViewConfigurationView * 2)()
 
         # callbacks
-        self._callback_action_events = {}
-        self._callback_action_pose_events = {}
+        self._action_event_dispatchers = []
+        self._pose_remap_jit = None
         self._callback_middle_render = None
+        self._render_callback_trampolines = {}
         self._callback_render = None
 
     def init(self, graphics: str = "OpenGL", use_ctypes: bool = False) -> bool:
@@ -202,30 +317,46 @@ class OpenXR:
             extension_path = __file__[:__file__.find("/semu/xr/openxr")]
         
         if self._disable_openxr:
+            self._bind_frame_functions()
             return True
 
         try:
+            # auxiliary libraries (plain C libraries loaded globally to resolve the symbols of the OpenXR library)
+            for library in ["libGL.so", "libSDL2.so", "libopenxr_loader.so"]:
+                ctypes.CDLL(os.path.join(extension_path, "bin", library), mode = ctypes.RTLD_GLOBAL | os.RTLD_LAZY)
+
             # ctypes
             if self._use_ctypes:
-                ctypes.PyDLL(os.path.join(extension_path, "bin", "libGL.so"), mode = ctypes.RTLD_GLOBAL)
-                ctypes.PyDLL(os.path.join(extension_path, "bin", "libSDL2.so"), mode = ctypes.RTLD_GLOBAL)
-                ctypes.PyDLL(os.path.join(extension_path, "bin", "libopenxr_loader.so"), mode = ctypes.RTLD_GLOBAL)
-                
                 self._lib = ctypes.PyDLL(os.path.join(extension_path, "bin", "xrlib_c.so"), mode = ctypes.RTLD_GLOBAL)
-                self._app = self._lib.openXrApplication()
+
+                # bind the library functions once with explicit prototypes
+                app_p, int_p, bool_p, char_p = ctypes.c_void_p, ctypes.c_int, ctypes.c_bool, ctypes.c_char_p
+                self._c_openXrApplication = _ctypes_function(self._lib, "openXrApplication", app_p, [])
+                self._c_destroy = _ctypes_function(self._lib, "destroy", bool_p, [app_p])
+                self._c_isSessionRunning = _ctypes_function(self._lib, "isSessionRunning", bool_p, [app_p])
+                self._c_getViewConfigurationViews = _ctypes_function(self._lib, "getViewConfigurationViews", bool_p, [app_p, ctypes.POINTER(XrViewConfigurationView), int_p])
+                self._c_getViewConfigurationViewsSize = _ctypes_function(self._lib, "getViewConfigurationViewsSize", int_p, [app_p])
+                self._c_createInstance = _ctypes_function(self._lib, "createInstance", bool_p, [app_p, char_p, char_p, ctypes.POINTER(char_p), int_p, ctypes.POINTER(char_p), int_p])
+                self._c_getSystem = _ctypes_function(self._lib, "getSystem", bool_p, [app_p, int_p, int_p, int_p])
+                self._c_createSession = _ctypes_function(self._lib, "createSession", bool_p, [app_p])
+                self._c_addAction = _ctypes_function(self._lib, "addAction", bool_p, [app_p, char_p, int_p, int_p])
+                self._c_applyHapticFeedback = _ctypes_function(self._lib, "applyHapticFeedback", bool_p, [app_p, char_p, ctypes.c_float, ctypes.c_int64, ctypes.c_float])
+                self._c_stopHapticFeedback = _ctypes_function(self._lib, "stopHapticFeedback", bool_p, [app_p, char_p])
+                self._c_pollEvents = _ctypes_function(self._lib, "pollEvents", bool_p, [app_p, ctypes.POINTER(ctypes.c_bool)])
+                self._c_pollActions = _ctypes_function(self._lib, "pollActions", bool_p, [app_p, ctypes.POINTER(ActionState), int_p])
+                self._c_renderViews = _ctypes_function(self._lib, "renderViews", bool_p, [app_p, int_p, ctypes.POINTER(ActionPoseState), int_p])
+                self._c_setRenderCallback = _ctypes_function(self._lib, "setRenderCallback", None, [app_p, _RENDER_CALLBACK_TYPE])
+                self._c_setFrames = _ctypes_function(self._lib, "setFrames", bool_p, [app_p, int_p, int_p, ctypes.c_void_p, int_p, int_p, ctypes.c_void_p, bool_p])
+
+                self._app = self._c_openXrApplication()
                 print("[INFO] OpenXR initialized using ctypes interface")
             
             # pybind11
             else:
-                sys.setdlopenflags(os.RTLD_GLOBAL | os.RTLD_LAZY)
-                sys.path.append(os.path.join(extension_path, "bin"))
-                # change cwd
-                tmp_dir= os.getcwd()
-                os.chdir(extension_path)
-                #import library
-                import xrlib_p
-                #restore cwd
-                os.chdir(tmp_dir)
+                # import library from its file (without modifying sys.path or the current working directory)
+                spec = importlib.util.spec_from_file_location("xrlib_p", os.path.join(extension_path, "bin", "xrlib_p.so"))
+                xrlib_p = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(xrlib_p)
 
                 self._lib = xrlib_p
                 self._app = xrlib_p.OpenXrApplication()
@@ -234,6 +365,28 @@ class OpenXR:
             print("[ERROR] OpenXR initialization:", e)
             return False
 
+        self._bind_frame_functions()
+        return True
+
+    def _bind_frame_functions(self) -> None:
+        # resolve the interface of the functions called every frame once, shadowing the public methods
+        if self._disable_openxr:
+            self.is_session_running = self._return_true
+            self.poll_events = self._return_true
+            self.poll_actions = self._return_true
+            self.render_views = self._render_views_disabled
+        elif self._use_ctypes:
+            self.is_session_running = self._is_session_running_ctypes
+            self.poll_events = self._poll_events_ctypes
+            self.poll_actions = self._poll_actions_ctypes
+            self.render_views = self._render_views_ctypes
+        else:
+            self.is_session_running = self._is_session_running_pybind
+            self.poll_events = self._poll_events_pybind
+            self.poll_actions = self._poll_actions_pybind
+            self.render_views = self._render_views_pybind
+
+    def _return_true(self, *args, **kwargs) -> bool:
         return True
 
     def destroy(self) -> bool:
@@ -245,9 +398,13 @@ class OpenXR:
         bool
             True if destruction was successful, otherwise False
         """
+        if self._transform_executor is not None:
+            self._transform_executor.shutdown(wait=False)
+            self._transform_executor = None
+
         if self._app is not None:
             if self._use_ctypes:
-                return bool(self._lib.destroy(self._app))
+                return self._c_destroy(self._app)
             else:
                 return self._app.destroy()
         self._lib = None
@@ -267,9 +424,15 @@ class OpenXR:
             return True
 
         if self._use_ctypes:
-            return bool(self._lib.isSessionRunning(self._app))
+            return self._is_session_running_ctypes()
         else:
-            return self._app.isSessionRunning()
+            return self._is_session_running_pybind()
+
+    def _is_session_running_ctypes(self) -> bool:
+        return self._c_isSessionRunning(self._app)
+
+    def _is_session_running_pybind(self) -> bool:
+        return self._app.isSessionRunning()
 
     def create_instance(self, application_name: str = "Omniverse (XR)", engine_name: str = "", api_layers: list = [], extensions: list = []) -> bool:
         """
@@ -302,24 +465,16 @@ class OpenXR:
             return True
 
         if self._graphics not in extensions:
-            extensions += [self._graphics]
+            extensions = extensions + [self._graphics]
         
         if self._use_ctypes:
-            # format API layes
-            requested_api_layers = (ctypes.c_char_p * len(api_layers))()
-            requested_api_layers[:] = [layer.encode('utf-8') for layer in api_layers]
-
-            # format extensions
-            requested_extensions = (ctypes.c_char_p * len(extensions))()
-            requested_extensions[:] = [extension.encode('utf-8') for extension in extensions]
-
-            return bool(self._lib.createInstance(self._app, 
-                                                 ctypes.create_string_buffer(application_name.encode('utf-8')),
-                                                 ctypes.create_string_buffer(engine_name.encode('utf-8')),
-                                                 requested_api_layers,
-                                                 len(api_layers),
-                                                 requested_extensions,
-                                                 len(extensions)))
+            return self._c_createInstance(self._app, 
+                                          _encode(application_name),
+                                          _encode(engine_name),
+                                          _encode_array(tuple(api_layers)),
+                                          len(api_layers),
+                                          _encode_array(tuple(extensions)),
+                                          len(extensions))
         else:
             return self._app.createInstance(application_name, engine_name, api_layers, extensions)
 
@@ -367,8 +522,11 @@ class OpenXR:
         if self._disable_openxr:
             return True
 
+        # the view configuration views are enumerated when getting the system
+        self._invalidate_resolutions()
+
         if self._use_ctypes:
-            return bool(self._lib.getSystem(self._app, form_factor, blend_mode, view_configuration_type))
+            return self._c_getSystem(self._app, form_factor, blend_mode, view_configuration_type)
         else:
             return self._app.getSystem(form_factor, blend_mode, view_configuration_type)
 
@@ -397,7 +555,7 @@ class OpenXR:
             return True
 
         if self._use_ctypes:
-            return bool(self._lib.createSession(self._app))
+            return self._c_createSession(self._app)
         else:
             return self._app.createSession()
 
@@ -419,12 +577,17 @@ class OpenXR:
             return True
 
         if self._use_ctypes:
-            exit_loop = ctypes.c_bool(False)
-            result = bool(self._lib.pollEvents(self._app, ctypes.byref(exit_loop)))
-            return result and not exit_loop.value
+            return self._poll_events_ctypes()
         else:
-            result = self._app.pollEvents()
-            return result[0] and not result[1]
+            return self._poll_events_pybind()
+
+    def _poll_events_ctypes(self) -> bool:
+        result = self._c_pollEvents(self._app, self._exit_loop_ref)
+        return result and not self._exit_loop.value
+
+    def _poll_events_pybind(self) -> bool:
+        result = self._app.pollEvents()
+        return result[0] and not result[1]
 
     def poll_actions(self) -> bool:
         """
@@ -446,43 +609,31 @@ class OpenXR:
             return True
 
         if self._use_ctypes:
-            requested_action_states = (ActionState * len(self._callback_action_events.keys()))()
-            result = bool(self._lib.pollActions(self._app, requested_action_states, len(requested_action_states)))
-
-            for state in requested_action_states:
-                value = None
-                if not state.type:
-                    break
-                if state.type == XR_ACTION_TYPE_BOOLEAN_INPUT:
-                    value = state.stateBool
-                elif state.type == XR_ACTION_TYPE_FLOAT_INPUT:
-                    value = state.stateFloat
-                elif state.type == XR_ACTION_TYPE_VECTOR2F_INPUT:
-                    value = (state.stateVectorX, state.stateVectorY)
-                elif state.type == XR_ACTION_TYPE_POSE_INPUT:
-                    continue
-                elif state.type == XR_ACTION_TYPE_VIBRATION_OUTPUT:
-                    continue
-                self._callback_action_events[state.path.decode("utf-8")](state.path.decode("utf-8"), value)
-            return result
-        
+            return self._poll_actions_ctypes()
         else:
-            result = self._app.pollActions()
-
-            for state in result[1]:
-                value = None
-                if state["type"] == XR_ACTION_TYPE_BOOLEAN_INPUT:
-                    value = state["stateBool"]
-                elif state["type"] == XR_ACTION_TYPE_FLOAT_INPUT:
-                    value = state["stateFloat"]
-                elif state["type"] == XR_ACTION_TYPE_VECTOR2F_INPUT:
-                    value = (state["stateVectorX"], state["stateVectorY"])
-                elif state["type"] == XR_ACTION_TYPE_POSE_INPUT:
-                    continue
-                elif state["type"] == XR_ACTION_TYPE_VIBRATION_OUTPUT:
-                    continue
-                self._callback_action_events[state["path"]](state["path"], value)
-            return result[0]
+            return self._poll_actions_pybind()
+
+    def _poll_actions_ctypes(self) -> bool:
+        # the library only fills the changed states, the first zeroed state marks the end
+        ctypes.memset(self._action_states, 0, ctypes.sizeof(self._action_states))
+        result = self._c_pollActions(self._app, self._action_states, self._n_actions)
+
+        for state in self._action_states:
+            if not state.type:
+                break
+            path, callback, extractor = self._action_event_dispatchers[state.index]
+            if extractor is not None:
+                callback(path, extractor(state))
+        return result
+
+    def _poll_actions_pybind(self) -> bool:
+        result = self._app.pollActions()
+
+        for state in result[1]:
+            path, callback, extractor = self._action_event_dispatchers[state["index"]]
+            if extractor is not None:
+                callback(path, extractor(state))
+        return result[0]
 
     def render_views(self, reference_space: int = 2) -> bool:
         """
@@ -508,45 +659,98 @@ class OpenXR:
         bool
             True if there is no error during rendering, otherwise False
         """
-        if self._callback_render is None:
-            print("[INFO] No callback has been established for rendering events. Internal callback will be used")
-            self.subscribe_render_event()
-
         if self._disable_openxr:
-            # test sensor reading
-            if self._viewport_window_left is not None:
-                frame_left = sensors.get_rgb(self._viewport_window_left)
-                cv2.imshow("frame_left {}".format(frame_left.shape), frame_left)
-                cv2.waitKey(1)
-            if self._viewport_window_right is not None:
-                frame_right = sensors.get_rgb(self._viewport_window_right)
-                cv2.imshow("frame_right {}".format(frame_right.shape), frame_right)
-                cv2.waitKey(1)
-            return True
+            return self._render_views_disabled(reference_space)
 
         if self._use_ctypes:
-            requested_action_pose_states = (ActionPoseState * len(self._callback_action_pose_events.keys()))()
-            result =  bool(self._lib.renderViews(self._app, reference_space, requested_action_pose_states, len(requested_action_pose_states)))
+            return self._render_views_ctypes(reference_space)
+        else:
+            return self._render_views_pybind(reference_space)
+
+    def _subscribe_internal_render_event(self) -> None:
+        print("[INFO] No callback has been established for rendering events. Internal callback will be used")
+        self.subscribe_render_event()
+
+    def _render_views_disabled(self, reference_space: int = 2) -> bool:
+        if self._callback_render is None:
+            self._subscribe_internal_render_event()
+
+        # test sensor reading (OpenCV is imported on demand since it is only needed here and for fitting frames)
+        # the RGB(A) sensor data is shown through a channel-reversed view only to fix the channel order (OpenCV expects BGR),
+        # the negative-stride view is still copied by OpenCV internally
+        import cv2
+        if self._viewport_window_left is not None:
+            frame_left = sensors.get_rgb(self._viewport_window_left)
+            cv2.imshow("frame_left {}".format(frame_left.shape), frame_left[..., 2::-1])
+        if self._viewport_window_right is not None:
+            frame_right = sensors.get_rgb(self._viewport_window_right)
+            cv2.imshow("frame_right {}".format(frame_right.shape), frame_right[..., 2::-1])
+        # process the window events once for both frames
+        if self._viewport_window_left is not None or self._viewport_window_right is not None:
+            cv2.waitKey(1)
+        return True
 
-            for state in requested_action_pose_states:
-                value = None
+    def _render_views_ctypes(self, reference_space: int = 2) -> bool:
+        if self._callback_render is None:
+            self._subscribe_internal_render_event()
+
+        ctypes.memset(self._action_pose_states, 0, ctypes.sizeof(self._action_pose_states))
+        result = self._c_renderViews(self._app, reference_space, self._action_pose_states, self._n_pose_actions)
+
+        # convert the poses one by one for a few pose actions (e.g. 1-2 controllers)
+        if self._n_pose_actions < _BATCH_POSE_THRESHOLD:
+            for state in self._action_pose_states:
                 if state.type == XR_ACTION_TYPE_POSE_INPUT and state.isActive:
-                    value = (Gf.Vec3d(state.pose.position.x, -state.pose.position.z, state.pose.position.y) / self._meters_per_unit,
-                             Gf.Quatd(state.pose.orientation.w, state.pose.orientation.x, state.pose.orientation.y, state.pose.orientation.z))
-                    self._callback_action_pose_events[state.path.decode("utf-8")](state.path.decode("utf-8"), value)
+                    position, orientation = state.pose.position, state.pose.orientation
+                    self._dispatch_action_pose_event(state.index, position.x, position.y, position.z, orientation.w, orientation.x, orientation.y, orientation.z)
             return result
 
-        else:
-            result = self._app.renderViews(reference_space)
-
-            for state in result[1]:
-                value = None
-                if state["type"] == XR_ACTION_TYPE_POSE_INPUT and state["isActive"]:
-                    value = (Gf.Vec3d(state["pose"]["position"]["x"], -state["pose"]["position"]["z"], state["pose"]["position"]["y"]) / self._meters_per_unit,
-                             Gf.Quatd(state["pose"]["orientation"]["w"], state["pose"]["orientation"]["x"], state["pose"]["orientation"]["y"], state["pose"]["orientation"]["z"]))
-                    self._callback_action_pose_events[state["path"]](state["path"], value)
-            return result[0]
+        # convert the poses of all active states at once
+        states = np.frombuffer(self._action_pose_states, dtype=_APSTATE_DTYPE)
+        indexes = np.flatnonzero((states["type"] == XR_ACTION_TYPE_POSE_INPUT) & states["isActive"])
+        if indexes.size:
+            poses = states["pose"][indexes]
+            self._dispatch_action_pose_events(states["index"][indexes].tolist(), np.stack([poses[name] for name in ["px", "py", "pz", "ow", "ox", "oy", "oz"]], axis=1))
+        return result
+
+    def _render_views_pybind(self, reference_space: int = 2) -> bool:
+        if self._callback_render is None:
+            self._subscribe_internal_render_event()
+
+        result = self._app.renderViewsInto(reference_space, self._action_poses, self._action_poses_active)
+
+        # convert the poses one by one for a few pose actions (e.g. 1-2 controllers)
+        if len(self._action_pose_indexes) < _BATCH_POSE_THRESHOLD:
+            for index, active, pose in zip(self._action_pose_indexes, self._action_poses_active.tolist(), self._action_poses.tolist()):
+                if active:
+                    self._dispatch_action_pose_event(index, *pose)
+            return result
+
+        # convert the poses of all active states at once
+        indexes = np.flatnonzero(self._action_poses_active)
+        if indexes.size:
+            poses = self._action_poses[indexes]
+            self._dispatch_action_pose_events([self._action_pose_indexes[i] for i in indexes.tolist()], poses)
+        return result
     
+    def _dispatch_action_pose_event(self, index: int, px: float, py: float, pz: float, ow: float, ox: float, oy: float, oz: float) -> None:
+        # position (x, y, z) and orientation (w, x, y, z) in the OpenXR coordinate system
+        path, callback, _ = self._action_event_dispatchers[index]
+        callback(path, (Gf.Vec3d(px / self._meters_per_unit, -pz / self._meters_per_unit, py / self._meters_per_unit), Gf.Quatd(ow, ox, oy, oz)))
+
+    def _dispatch_action_pose_events(self, indexes: list, poses: np.ndarray) -> None:
+        # poses rows: position (x, y, z) and orientation (w, x, y, z) in the OpenXR coordinate system
+        remapped_poses = np.empty(poses.shape, dtype=np.float64)
+        if self._pose_remap_jit is not None:
+            self._pose_remap_jit(poses, remapped_poses, self._meters_per_unit)
+        else:
+            remapped_poses[:, :3] = poses[:, :3] @ self._position_transform.T
+            remapped_poses[:, 3:] = poses[:, 3:]
+
+        for index, pose in zip(indexes, remapped_poses.tolist()):
+            path, callback, _ = self._action_event_dispatchers[index]
+            callback(path, (Gf.Vec3d(*pose[:3]), Gf.Quatd(*pose[3:])))
+
     # action utilities
 
     def subscribe_action_event(self, path: str, callback: Union[Callable[[str, object], None], None] = None, action_type: Union[int, None] = None, reference_space: Union[int, None] = 2) -> bool:
@@ -595,8 +799,9 @@ class OpenXR:
             Callback invoked when the state of the action changes
         action_type: {XR_ACTION_TYPE_BOOLEAN_INPUT, XR_ACTION_TYPE_FLOAT_INPUT, XR_ACTION_TYPE_VECTOR2F_INPUT, XR_ACTION_TYPE_POSE_INPUT, XR_ACTION_TYPE_VIBRATION_OUTPUT} or None, optional
             Action [type](https://www.khronos.org/registry/OpenXR/specs/1.0/html/xrspec.html#XrActionType) from XrActionType enum (default: None)
-        reference_space: {XR_REFERENCE_SPACE_TYPE_VIEW, XR_REFERENCE_SPACE_TYPE_LOCAL, XR_REFERENCE_SPACE_TYPE_STAGE}, optional
-            Desired [reference space](https://www.khronos.org/registry/OpenXR/specs/1.0/html/xrspec.html#reference-spaces) type from XrReferenceSpaceType enum used to retrieve the pose (default: XR_REFERENCE_SPACE_TYPE_LOCAL)
+        reference_space: {XR_REFERENCE_SPACE_TYPE_VIEW, XR_REFERENCE_SPACE_TYPE_LOCAL, XR_REFERENCE_SPACE_TYPE_STAGE} or None, optional
+            Desired [reference space](https://www.khronos.org/registry/OpenXR/specs/1.0/html/xrspec.html#reference-spaces) type from XrReferenceSpaceType enum used to retrieve the pose.
+            If None, XR_REFERENCE_SPACE_TYPE_LOCAL will be used (default: XR_REFERENCE_SPACE_TYPE_LOCAL)
 
         Returns
         -------
@@ -604,32 +809,48 @@ class OpenXR:
             True if there is no error during action creation, otherwise False
         """
         if action_type is None:
-            if path.split("/")[-1] in ["click", "touch"]:
-                action_type = XR_ACTION_TYPE_BOOLEAN_INPUT
-            elif path.split("/")[-1] in ["value", "force"]:
-                action_type = XR_ACTION_TYPE_FLOAT_INPUT
-            elif path.split("/")[-1] in ["x", "y"]:
-                action_type = XR_ACTION_TYPE_VECTOR2F_INPUT
-            elif path.split("/")[-1] in ["pose"]:
-                action_type = XR_ACTION_TYPE_POSE_INPUT
-            elif path.split("/")[-1] in ["haptic", "haptic_left", "haptic_right", "haptic_left_trigger", "haptic_right_trigger"]:
-                action_type = XR_ACTION_TYPE_VIBRATION_OUTPUT
-            else:
+            action_type = _SUFFIX_TO_TYPE.get(path.rpartition("/")[2])
+            if action_type is None:
                 raise ValueError("The action type cannot be retrieved from the path {}".format(path))
         
         if callback is None and action_type != XR_ACTION_TYPE_VIBRATION_OUTPUT:
             raise ValueError("The callback was not defined")
-        self._callback_action_events[path] = callback
-        if action_type == XR_ACTION_TYPE_POSE_INPUT:
-            self._callback_action_pose_events[path] = callback
         
         if self._disable_openxr:
             return True
 
+        # the reference space is passed as int to the libraries
+        if reference_space is None:
+            reference_space = XR_REFERENCE_SPACE_TYPE_LOCAL
+
         if self._use_ctypes:
-            return bool(self._lib.addAction(self._app, ctypes.create_string_buffer(path.encode('utf-8')), action_type, reference_space))
+            status = self._c_addAction(self._app, _encode(path), action_type, reference_space)
         else:
-            return self._app.addAction(path, action_type, reference_space)
+            status = self._app.addAction(path, action_type, reference_space)
+        if not status:
+            return False
+
+        # the library identifies the action states by the order in which the actions were added (index).
+        # Precompute the dispatcher (path, callback, value extractor or None) for that index
+        extractors = _ACTION_STATE_EXTRACTORS if self._use_ctypes else _ACTION_STATE_DICT_EXTRACTORS
+        self._action_event_dispatchers.append((path, callback, extractors.get(action_type)))
+        if action_type == XR_ACTION_TYPE_POSE_INPUT:
+            self._action_pose_indexes.append(len(self._action_event_dispatchers) - 1)
+            # compile the pose remapping here (once, memoized), outside the frame loop where the poses are dispatched
+            if len(self._action_pose_indexes) == 1:
+                self._pose_remap_jit = _get_pose_remap_jit()
+
+        # reallocate the buffers used for polling and rendering (the pose states are reported in the order the pose actions were added)
+        if self._use_ctypes:
+            self._n_actions = len(self._action_event_dispatchers)
+            self._action_states = (ActionState * self._n_actions)()
+            if action_type == XR_ACTION_TYPE_POSE_INPUT:
+                self._n_pose_actions = len(self._action_pose_indexes)
+                self._action_pose_states = (ActionPoseState * self._n_pose_actions)()
+        elif action_type == XR_ACTION_TYPE_POSE_INPUT:
+            self._action_poses = np.zeros((len(self._action_pose_indexes), 7), dtype=np.float32)
+            self._action_poses_active = np.zeros((len(self._action_pose_indexes),), dtype=np.bool_)
+        return True
 
     def apply_haptic_feedback(self, path: str, haptic_feedback: dict = {}) -> bool:
         """
@@ -659,10 +880,8 @@ class OpenXR:
             return True
 
         if self._use_ctypes:
-            amplitude = ctypes.c_float(amplitude)
-            duration = ctypes.c_int64(duration)
-            frequency = ctypes.c_float(frequency)
-            return bool(self._lib.applyHapticFeedback(self._app, ctypes.create_string_buffer(path.encode('utf-8')), amplitude, duration, frequency))
+            # the scalars are converted according to the function prototype
+            return self._c_applyHapticFeedback(self._app, _encode(path), amplitude, duration, frequency)
         else:
             return self._app.applyHapticFeedback(path, amplitude, duration, frequency)
 
@@ -687,7 +906,7 @@ class OpenXR:
             return True
 
         if self._use_ctypes:
-            return bool(self._lib.stopHapticFeedback(self._app, ctypes.create_string_buffer(path.encode('utf-8'))))
+            return self._c_stopHapticFeedback(self._app, _encode(path))
         else:
             return self._app.stopHapticFeedback(path)
 
@@ -781,10 +1000,10 @@ class OpenXR:
             self._viewport_window_right.set_texture_resolution(*resolutions[1])
 
         # set camera properties
-        for property in camera_properties:
-            self._prim_left.GetAttribute(property).Set(camera_properties[property])
-            if right_camera is not None:
-                self._prim_right.GetAttribute(property).Set(camera_properties[property])
+        prims = [self._prim_left] if right_camera is None else [self._prim_left, self._prim_right]
+        for prim in prims:
+            for property, value in camera_properties.items():
+                prim.GetAttribute(property).Set(value)
         
         # enable sensors
         if self._viewport_window_left is not None:
@@ -805,15 +1024,22 @@ class OpenXR:
         if self._disable_openxr:
             return ([512, 512], [1024, 1024])
 
+        if self._recommended_resolutions:
+            return self._recommended_resolutions
+
         if self._use_ctypes:
-            num_views = self._lib.getViewConfigurationViewsSize(self._app)
+            num_views = self._c_getViewConfigurationViewsSize(self._app)
             views = (XrViewConfigurationView * num_views)()
-            if self._lib.getViewConfigurationViews(self._app, views, num_views):
-                return [(view.recommendedImageRectWidth, view.recommendedImageRectHeight) for view in views]
+            if self._c_getViewConfigurationViews(self._app, views, num_views):
+                self._recommended_resolutions = tuple([(view.recommendedImageRectWidth, view.recommendedImageRectHeight) for view in views])
             else:
                 return tuple([])
         else:
-            return tuple([(view["recommendedImageRectWidth"], view["recommendedImageRectHeight"]) for view in self._app.getViewConfigurationViews()])
+            self._recommended_resolutions = tuple([(view["recommendedImageRectWidth"], view["recommendedImageRectHeight"]) for view in self._app.getViewConfigurationViews()])
+        return self._recommended_resolutions
+
+    def _invalidate_resolutions(self) -> None:
+        self._recommended_resolutions = None
 
     def set_reference_system_pose(self, position: Union[pxr.Gf.Vec3d, None] = None, rotation: Union[pxr.Gf.Vec3d, None] = None) -> None:
         """
@@ -842,17 +1068,23 @@ class OpenXR:
         x: float, optional
             Angle (in radians) of the Z-axis (default: 0)
         """
-        self._rectification_quat_left = pxr.Gf.Quatd(1, 0, 0, 0)
-        self._rectification_quat_right = pxr.Gf.Quatd(1, 0, 0, 0)
+        # compose the rotations locally and assign the resulting quaternions once (the right view uses the opposite angles)
+        quat_left = pxr.Gf.Quatd(1, 0, 0, 0)
+        quat_right = pxr.Gf.Quatd(1, 0, 0, 0)
         if x:   # w,x,y,z = cos(a/2), sin(a/2), 0, 0
-            self._rectification_quat_left *= pxr.Gf.Quatd(np.cos(x/2), np.sin(x/2), 0, 0)
-            self._rectification_quat_right *= pxr.Gf.Quatd(np.cos(-x/2), np.sin(-x/2), 0, 0)
+            cos, sin = math.cos(x * 0.5), math.sin(x * 0.5)
+            quat_left *= pxr.Gf.Quatd(cos, sin, 0, 0)
+            quat_right *= pxr.Gf.Quatd(cos, -sin, 0, 0)
         if y:   # w,x,y,z = cos(a/2), 0, sin(a/2), 0
-            self._rectification_quat_left *= pxr.Gf.Quatd(np.cos(y/2), 0, np.sin(y/2), 0)
-            self._rectification_quat_right *= pxr.Gf.Quatd(np.cos(-y/2), 0, np.sin(-y/2), 0)
+            cos, sin = math.cos(y * 0.5), math.sin(y * 0.5)
+            quat_left *= pxr.Gf.Quatd(cos, 0, sin, 0)
+            quat_right *= pxr.Gf.Quatd(cos, 0, -sin, 0)
         if z:   # w,x,y,z = cos(a/2), 0, 0, sin(a/2)
-            self._rectification_quat_left *= pxr.Gf.Quatd(np.cos(z/2), 0, 0, np.sin(z/2))
-            self._rectification_quat_right *= pxr.Gf.Quatd(np.cos(-z/2), 0, 0, np.sin(-z/2))
+            cos, sin = math.cos(z * 0.5), math.sin(z * 0.5)
+            quat_left *= pxr.Gf.Quatd(cos, 0, 0, sin)
+            quat_right *= pxr.Gf.Quatd(cos, 0, 0, -sin)
+        self._rectification_quat_left = quat_left
+        self._rectification_quat_right = quat_right
 
     def set_meters_per_unit(self, meters_per_unit: float):
         """
@@ -867,6 +1099,7 @@ class OpenXR:
         """
         assert meters_per_unit != 0
         self._meters_per_unit = meters_per_unit
+        self._position_transform = _POSITION_TRANSFORM / self._meters_per_unit
 
     def set_frame_transformations(self, fit: bool = False, flip: Union[int, tuple, None] = None) -> None:
         """
@@ -880,8 +1113,15 @@ class OpenXR:
         flip: int, tuple or None, optional
             Flip each image around vertical (0), horizontal (1), or both axes (0,1) (default: None) 
         """
+        flip_code = None
+        if flip is not None:
+            flip_code = _FLIP_CODES.get(tuple(sorted(flip)) if isinstance(flip, (tuple, list)) else (flip,))
+            if flip_code is None:
+                raise ValueError("Invalid flip ({}). Valid values are 0, 1, (0,1) or None".format(flip))
+
         self._transform_fit = fit
         self._transform_flip = flip
+        self._transform_flip_code = flip_code
 
     def teleport_prim(self, prim: pxr.Usd.Prim, position: pxr.Gf.Vec3d, rotation: pxr.Gf.Quatd, reference_position: Union[pxr.Gf.Vec3d, None] = None, reference_rotation: Union[pxr.Gf.Vec3d, None] = None) -> None:
         """
@@ -900,45 +1140,69 @@ class OpenXR:
         reference_rotation: pxr.Gf.Vec3d or None, optional
             Rotation (in degress) on each axis used as reference system (default: None)
         """
-        properties = prim.GetPropertyNames()
+        self._teleport_prim(prim, position, rotation.GetNormalized(), reference_position, reference_rotation)
 
-        # reference position
+    def _teleport_prim(self, prim: pxr.Usd.Prim, position: pxr.Gf.Vec3d, rotation: pxr.Gf.Quatd, reference_position: Union[pxr.Gf.Vec3d, None], reference_rotation: Union[pxr.Gf.Vec3d, None]) -> None:
+        # teleport_prim for unit quaternions (e.g. the view poses), whose rotation matrix is computed without normalization.
+        # OVERHEAD-BOUND (called per view and frame): keep the Python attribute accesses and object allocations to a minimum
+        translate_attribute, rotate_attribute, transform_attribute = self._get_xform_op_attributes(prim, reference_rotation is not None)
+
+        # position
         if reference_position is not None:
-            if "xformOp:translate" in properties or "xformOp:translation" in properties:
-                prim.GetAttribute("xformOp:translate").Set(reference_position + position)
-            else:
-                print("[INFO] Create UsdGeom.XformOp.TypeTranslate for", prim.GetPath())
-                UsdGeom.Xformable(prim).AddXformOp(UsdGeom.XformOp.TypeTranslate, UsdGeom.XformOp.PrecisionDouble, "").Set(reference_position + position)
+            translate_attribute.Set(reference_position + position)
         else:
-            if "xformOp:translate" in properties or "xformOp:translation" in properties:
-                prim.GetAttribute("xformOp:translate").Set(position)
-            else:
-                print("[INFO] Create UsdGeom.XformOp.TypeTranslate for", prim.GetPath())
-                UsdGeom.Xformable(prim).AddXformOp(UsdGeom.XformOp.TypeTranslate, UsdGeom.XformOp.PrecisionDouble, "").Set(position)
+            translate_attribute.Set(position)
 
         # reference rotation
         if reference_rotation is not None:
-            if "xformOp:rotate" in properties:
-                prim.GetAttribute("xformOp:rotate").Set(reference_rotation)
-            elif "xformOp:rotateXYZ" in properties:
-                try:
-                    prim.GetAttribute("xformOp:rotateXYZ").Set(reference_rotation)
-                except:
-                    prim.GetAttribute("xformOp:rotateXYZ").Set(Gf.Vec3f(reference_rotation))
+            try:
+                rotate_attribute.Set(reference_rotation)
+            except:
+                rotate_attribute.Set(Gf.Vec3f(reference_rotation))
+
+        # transform (the rotation matrix is computed from the quaternion in C++, without an intermediate Gf.Rotation)
+        if self._transform_matrix is None:
+            self._transform_matrix = Gf.Matrix4d(1)
+        self._transform_matrix.SetRotateOnly(rotation)
+        transform_attribute.Set(self._transform_matrix)
+
+    def _get_xform_op_attributes(self, prim: pxr.Usd.Prim, rotate: bool) -> tuple:
+        # translate, rotate (None if not requested) and transform operation attributes of the prim.
+        # The attributes are resolved (and the operations created, in that order, if they do not exist) once per prim,
+        # and again if any of them is no longer valid (e.g. the operation was removed)
+        attributes = self._xform_op_attributes.get(prim)
+        if attributes is not None and (not rotate or attributes[1] is not None) \
+            and all(attribute.IsValid() for attribute in attributes if attribute is not None):
+            return attributes
+
+        # translate
+        if prim.HasAttribute("xformOp:translate") or prim.HasAttribute("xformOp:translation"):
+            translate_attribute = prim.GetAttribute("xformOp:translate")
+        else:
+            print("[INFO] Create UsdGeom.XformOp.TypeTranslate for", prim.GetPath())
+            translate_attribute = UsdGeom.Xformable(prim).AddXformOp(UsdGeom.XformOp.TypeTranslate, UsdGeom.XformOp.PrecisionDouble, "").GetAttr()
+
+        # rotate
+        rotate_attribute = None
+        if rotate:
+            if prim.HasAttribute("xformOp:rotate"):
+                rotate_attribute = prim.GetAttribute("xformOp:rotate")
+            elif prim.HasAttribute("xformOp:rotateXYZ"):
+                rotate_attribute = prim.GetAttribute("xformOp:rotateXYZ")
             else:
                 print("[INFO] Create UsdGeom.XformOp.TypeRotateXYZ for", prim.GetPath())
-                UsdGeom.Xformable(prim).AddXformOp(UsdGeom.XformOp.TypeRotateXYZ, UsdGeom.XformOp.PrecisionDouble, "").Set(reference_rotation)
+                rotate_attribute = UsdGeom.Xformable(prim).AddXformOp(UsdGeom.XformOp.TypeRotateXYZ, UsdGeom.XformOp.PrecisionDouble, "").GetAttr()
 
         # transform
-        transform_matrix = Gf.Matrix4d()
-        transform_matrix.SetIdentity()
-        # transform_matrix.SetTranslateOnly(position)
-        transform_matrix.SetRotateOnly(Gf.Rotation(rotation))
-        if "xformOp:transform" in properties:
-            prim.GetAttribute("xformOp:transform").Set(transform_matrix)
+        if prim.HasAttribute("xformOp:transform"):
+            transform_attribute = prim.GetAttribute("xformOp:transform")
         else:
             print("[INFO] Create UsdGeom.XformOp.TypeTransform for", prim.GetPath())
-            UsdGeom.Xformable(prim).AddXformOp(UsdGeom.XformOp.TypeTransform, UsdGeom.XformOp.PrecisionDouble, "").Set(transform_matrix)
+            transform_attribute = UsdGeom.Xformable(prim).AddXformOp(UsdGeom.XformOp.TypeTransform, UsdGeom.XformOp.PrecisionDouble, "").GetAttr()
+
+        attributes = (translate_attribute, rotate_attribute, transform_attribute)
+        self._xform_op_attributes[prim] = attributes
+        return attributes
 
     def subscribe_render_event(self, callback=None) -> None:
         """
@@ -954,6 +1218,8 @@ class OpenXR:
            A [XrViewConfigurationView](https://www.khronos.org/registry/OpenXR/specs/1.0/html/xrspec.html#XrViewConfigurationView) structure specifies properties related to rendering of a view (e.g. the optimal width and height to be used when rendering the view).
            The length of the tuple corresponds to the number of views (if the tuple length is 2, index 0 represents the left eye and index 1 represents the right eye)
 
+        The views and configuration views structures are reused and overwritten on every render event (copy them to keep their values beyond the callback)
+
         The callback function must call the set_frames function to pass to the selected graphics API the image or images to be rendered
 
         If the callback is None, an internal callback will be used to render the views. This internal callback updates the pose of the cameras according to the specified reference system, gets the images from the previously configured viewports and invokes the set_frames function to render the views.
@@ -964,78 +1230,68 @@ class OpenXR:
             Callback invoked on each render event (default: None)
         """
         def _middle_callback(num_views, views, configuration_views):
-            _views = []
-            for v in views:
-                tmp = XrView()
-                tmp.type = v["type"]
-                tmp.next = None
-                tmp.pose = XrPosef()
-                tmp.pose.position.x = v["pose"]["position"]["x"]
-                tmp.pose.position.y = v["pose"]["position"]["y"]
-                tmp.pose.position.z = v["pose"]["position"]["z"]
-                tmp.pose.orientation.x = v["pose"]["orientation"]["x"]
-                tmp.pose.orientation.y = v["pose"]["orientation"]["y"]
-                tmp.pose.orientation.z = v["pose"]["orientation"]["z"]
-                tmp.pose.orientation.w = v["pose"]["orientation"]["w"]
-                tmp.fov = XrFovf()
-                tmp.fov.angleLeft = v["fov"]["angleLeft"]
-                tmp.fov.angleRight = v["fov"]["angleRight"]
-                tmp.fov.angleUp = v["fov"]["angleUp"]
-                tmp.fov.angleDown = v["fov"]["angleDown"]
-                _views.append(tmp)
-
-            _configuration_views = []
-            for v in configuration_views:
-                tmp = XrViewConfigurationView()
-                tmp.type = v["type"]
-                tmp.next = None
-                tmp.recommendedImageRectWidth = v["recommendedImageRectWidth"]
-                tmp.recommendedImageRectHeight = v["recommendedImageRectHeight"]
-                tmp.maxImageRectWidth = v["maxImageRectWidth"]
-                tmp.maxImageRectHeight = v["maxImageRectHeight"]
-                tmp.recommendedSwapchainSampleCount = v["recommendedSwapchainSampleCount"]
-                tmp.maxSwapchainSampleCount = v["maxSwapchainSampleCount"]
-                _configuration_views.append(tmp)
-
-            self._callback_render(num_views, _views, _configuration_views)
-
-        def _internal_render(num_views, views, configuration_views):
-            # teleport left camera
-            position = views[0].pose.position
-            rotation = views[0].pose.orientation
-            position = Gf.Vec3d(position.x, -position.z, position.y) / self._meters_per_unit
-            rotation = Gf.Quatd(rotation.w, rotation.x, rotation.y, rotation.z) * self._rectification_quat_left
-            self.teleport_prim(self._prim_left, position, rotation, self._reference_position, self._reference_rotation)            
+            # OVERHEAD-BOUND (called per frame): keep the Python attribute accesses and object allocations to a minimum.
+            # Copy the views and configuration views (raw C structures) into the preallocated ctypes structures
+            # (the arrays are reallocated when the number of views reported changes, so their length matches it)
+            if len(views) != ctypes.sizeof(self._xr_views):
+                self._xr_views = (XrView * (len(views) // ctypes.sizeof(XrView)))()
+            if len(configuration_views) != ctypes.sizeof(self._xr_configuration_views):
+                self._xr_configuration_views = (XrViewConfigurationView * (len(configuration_views) // ctypes.sizeof(XrViewConfigurationView)))()
+            ctypes.memmove(self._xr_views, views, len(views))
+            ctypes.memmove(self._xr_configuration_views, configuration_views, len(configuration_views))
+
+            self._callback_render(num_views, self._xr_views, self._xr_configuration_views)
 
-            # teleport right camera
-            if num_views == 2:
-                position = views[1].pose.position
-                rotation = views[1].pose.orientation
-                position = Gf.Vec3d(position.x, -position.z, position.y) / self._meters_per_unit
-                rotation = Gf.Quatd(rotation.w, rotation.x, rotation.y, rotation.z) * self._rectification_quat_right
-                self.teleport_prim(self._prim_right, position, rotation, self._reference_position, self._reference_rotation)
-            
-            # set frames
-            try:
-                frame_left = sensors.get_rgb(self._viewport_window_left)
-                frame_right = sensors.get_rgb(self._viewport_window_right) if num_views == 2 else None
-                self.set_frames(configuration_views, frame_left, frame_right)
-            except Exception as e:
-                print("[ERROR]", str(e))
-        
         self._callback_render = callback
         if callback is None:
-            self._callback_render = _internal_render
+            self._callback_render = self._internal_render
         
         if self._disable_openxr:
             return
 
         if self._use_ctypes:
-            self._callback_middle_render = ctypes.CFUNCTYPE(None, ctypes.c_int, ctypes.POINTER(XrView), ctypes.POINTER(XrViewConfigurationView))(self._callback_render)
-            self._lib.setRenderCallback(self._app, self._callback_middle_render)
+            # keep the C function pointer (trampoline) handed to the library alive and reuse it if the same callback is subscribed again.
+            # The trampolines of the callbacks that are no longer active are released
+            trampoline = self._render_callback_trampolines.get(self._callback_render)
+            if trampoline is None:
+                trampoline = _RENDER_CALLBACK_TYPE(self._callback_render)
+            self._callback_middle_render = trampoline
+            self._c_setRenderCallback(self._app, self._callback_middle_render)
+            self._render_callback_trampolines = {self._callback_render: trampoline}
         else:
             self._callback_middle_render = _middle_callback
-            self._app.setRenderCallback(self._callback_middle_render)
+            self._app.setRenderCallbackFromBuffers(self._callback_middle_render)
+
+    def _internal_render(self, num_views: int, views: list, configuration_views: list) -> None:
+        # default render callback (a method, so the same bound method, and its trampoline, is reused if it is subscribed again)
+        # teleport left camera
+        position = views[0].pose.position
+        rotation = views[0].pose.orientation
+        position = Gf.Vec3d(position.x, -position.z, position.y) / self._meters_per_unit
+        rotation = Gf.Quatd(rotation.w, rotation.x, rotation.y, rotation.z) * self._rectification_quat_left
+        self._teleport_prim(self._prim_left, position, rotation, self._reference_position, self._reference_rotation)            
+
+        # teleport right camera
+        if num_views == 2:
+            position = views[1].pose.position
+            rotation = views[1].pose.orientation
+            position = Gf.Vec3d(position.x, -position.z, position.y) / self._meters_per_unit
+            rotation = Gf.Quatd(rotation.w, rotation.x, rotation.y, rotation.z) * self._rectification_quat_right
+            self._teleport_prim(self._prim_right, position, rotation, self._reference_position, self._reference_rotation)
+        
+        # set frames (skip them, without reading the right view if the left one is empty, while the sensors have no data)
+        try:
+            frame_left = sensors.get_rgb(self._viewport_window_left)
+            if not frame_left.size:
+                return
+            frame_right = None
+            if num_views == 2:
+                frame_right = sensors.get_rgb(self._viewport_window_right)
+                if not frame_right.size:
+                    return
+            self.set_frames(configuration_views, frame_left, frame_right)
+        except Exception as e:
+            print("[ERROR]", str(e))
 
     def set_frames(self, configuration_views: list, left: numpy.ndarray, right: numpy.ndarray = None) -> bool:
         """
@@ -1065,44 +1321,82 @@ class OpenXR:
         if self._disable_openxr:
             return True
 
+        # MEMORY-BOUND (multi-MB frames per view): avoid copies, each one moves a full frame through memory.
+        # transform the frames (in stereo, the right frame is flipped/fitted in a worker thread since OpenCV releases the GIL).
+        # Without transformations there is nothing to offload (_transform passes the frames as they are if already contiguous)
+        if right is None or (self._transform_flip is None and not self._transform_fit):
+            frame_left = self._transform(configuration_views[0], left, 0)
+            frame_right = None if right is None else self._transform(configuration_views[1], right, 1)
+        else:
+            if self._transform_executor is None:
+                self._transform_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            future = self._transform_executor.submit(self._transform, configuration_views[1], right, 1)
+            frame_left = self._transform(configuration_views[0], left, 0)
+            frame_right = future.result()
+
         if self._use_ctypes:
-            self._frame_left = self._transform(configuration_views[0], left)
+            # both frames are submitted in a single call, with their data pointers passed as integers (converted to void *
+            # according to the function prototype). The pointers are only read again when the transformed frame is a different array
+            if frame_left is not self._frame_left:
+                self._frame_left = frame_left
+                self._frame_left_pointer = frame_left.__array_interface__["data"][0]
             if right is None:
-                return bool(self._lib.setFrames(self._app, 
-                                                self._frame_left.shape[1], self._frame_left.shape[0], self._frame_left.ctypes.data_as(ctypes.c_void_p),
-                                                0, 0, None, 
-                                                use_rgba))
+                return self._c_setFrames(self._app, 
+                                         self._frame_left.shape[1], self._frame_left.shape[0], self._frame_left_pointer,
+                                         0, 0, None, 
+                                         use_rgba)
             else:
-                self._frame_right = self._transform(configuration_views[1], right)
-                return bool(self._lib.setFrames(self._app, 
-                                                self._frame_left.shape[1], self._frame_left.shape[0], self._frame_left.ctypes.data_as(ctypes.c_void_p),
-                                                self._frame_right.shape[1], self._frame_right.shape[0], self._frame_right.ctypes.data_as(ctypes.c_void_p),
-                                                use_rgba))
+                if frame_right is not self._frame_right:
+                    self._frame_right = frame_right
+                    self._frame_right_pointer = frame_right.__array_interface__["data"][0]
+                return self._c_setFrames(self._app, 
+                                         self._frame_left.shape[1], self._frame_left.shape[0], self._frame_left_pointer,
+                                         self._frame_right.shape[1], self._frame_right.shape[0], self._frame_right_pointer,
+                                         use_rgba)
         else:
-            self._frame_left = self._transform(configuration_views[0], left)
+            self._frame_left = frame_left
             if right is None:
                 return self._app.setFrames(self._frame_left, np.array(None), use_rgba)
             else:
-                self._frame_right = self._transform(configuration_views[1], right)
+                self._frame_right = frame_right
                 return self._app.setFrames(self._frame_left, self._frame_right, use_rgba)
 
-    def _transform(self, configuration_view: XrViewConfigurationView, frame: np.ndarray) -> np.ndarray:
-        transformed = False
+    def _transform(self, configuration_view: XrViewConfigurationView, frame: np.ndarray, index: int) -> np.ndarray:
+        # MEMORY-BOUND (multi-MB frames per view): one OpenCV pass per transformation into reused buffers, no extra copies
+        # the library reads the frames as contiguous memory (copy only the views, e.g. sliced sensor frames)
+        if self._transform_flip is None and not self._transform_fit:
+            if frame.flags.c_contiguous:
+                return frame
+            buffer = self._get_transform_buffer(index, "copy", frame.shape, frame.dtype)
+            np.copyto(buffer, frame)
+            return buffer
+
+        # OpenCV is imported on demand since it is only needed for transforming frames (and for the preview).
+        # Its output (flipped or resized frames) is written into contiguous buffers reused between frames
+        import cv2
         if self._transform_flip is not None:
-            transformed = True
-            frame = np.flip(frame, axis=self._transform_flip)
+            frame = cv2.flip(frame, self._transform_flip_code, dst=self._get_transform_buffer(index, "flip", frame.shape, frame.dtype))
         if self._transform_fit:
-            transformed = True
+            # crop from the center (a strided view that OpenCV reads in place) and scale in the same resize pass
             current_ratio = frame.shape[1] / frame.shape[0]
             recommended_ratio = configuration_view.recommendedImageRectWidth / configuration_view.recommendedImageRectHeight
             recommended_size = (configuration_view.recommendedImageRectWidth, configuration_view.recommendedImageRectHeight)
+            buffer = self._get_transform_buffer(index, "fit", (recommended_size[1], recommended_size[0]) + frame.shape[2:], frame.dtype)
             if current_ratio > recommended_ratio:
                 m = int(abs(recommended_ratio * frame.shape[0] - frame.shape[1]) / 2)
-                frame = cv2.resize(frame[:, m:-m] if m else frame, recommended_size, interpolation=cv2.INTER_LINEAR)
+                frame = cv2.resize(frame[:, m:-m] if m else frame, recommended_size, dst=buffer, interpolation=cv2.INTER_LINEAR)
             else:
                 m = int(abs(frame.shape[1] / recommended_ratio - frame.shape[0]) / 2)
-                frame = cv2.resize(frame[m:-m, :] if m else frame, recommended_size, interpolation=cv2.INTER_LINEAR)
-        return np.array(frame, copy=True) if transformed else frame
+                frame = cv2.resize(frame[m:-m, :] if m else frame, recommended_size, dst=buffer, interpolation=cv2.INTER_LINEAR)
+        return frame
+
+    def _get_transform_buffer(self, index: int, name: str, shape: tuple, dtype: np.dtype) -> np.ndarray:
+        # output buffer of a transformation for the view with the given index (reallocated when the frame size changes)
+        buffer = self._transform_buffers.get((index, name))
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = np.empty(shape, dtype=dtype)
+            self._transform_buffers[(index, name)] = buffer
+        return buffer
 
 
 
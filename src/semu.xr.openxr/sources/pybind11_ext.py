@@ -25,7 +25,7 @@ ext_modules = [
                                     os.path.join(os.getcwd(), "thirdparty", "sdl2", "lib"),
                                     python_library_dir],
                       libraries=["openxr_loader", "GL", "SDL2"],
-                      extra_link_args=["-Wl,-rpath=./bin"],
+                      extra_link_args=["-Wl,-rpath=$ORIGIN"],
                       undef_macros=["CTYPES", "APPLICATION"]),
 ]
 
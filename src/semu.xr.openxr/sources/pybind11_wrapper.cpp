@@ -80,6 +80,7 @@ namespace pybind11 { namespace detail {
                 PyObject * state = PyDict_New();
                 PyDict_SetItemString(state, "type", PyLong_FromLong(src.type));
                 PyDict_SetItemString(state, "path", PyUnicode_FromString(src.path));
+                PyDict_SetItemString(state, "index", PyLong_FromLong(src.index));
                 PyDict_SetItemString(state, "isActive", PyBool_FromLong(src.isActive));
                 PyDict_SetItemString(state, "stateBool", PyBool_FromLong(src.stateBool));
                 PyDict_SetItemString(state, "stateFloat", PyFloat_FromDouble(src.stateFloat));
@@ -100,6 +101,7 @@ namespace pybind11 { namespace detail {
                 PyObject * state = PyDict_New();
                 PyDict_SetItemString(state, "type", PyLong_FromLong(src.type));
                 PyDict_SetItemString(state, "path", PyUnicode_FromString(src.path));
+                PyDict_SetItemString(state, "index", PyLong_FromLong(src.index));
                 PyDict_SetItemString(state, "isActive", PyBool_FromLong(src.isActive));
                 
                 PyObject * position = PyDict_New();
@@ -168,8 +170,38 @@ PYBIND11_MODULE(xrlib_p, m){
                 bool returnValue = m.renderViews(XrReferenceSpaceType(referenceSpaceType), actionPoseState);
                 return std::make_tuple(returnValue, actionPoseState); 
             })
+        .def("renderViewsInto", [](OpenXrApplication &m, int referenceSpaceType, py::array_t<float> poses, py::array_t<bool> active){
+                vector<ActionPoseState> actionPoseState;
+                bool returnValue = m.renderViews(XrReferenceSpaceType(referenceSpaceType), actionPoseState);
+                // one row per pose action: position (x, y, z) and orientation (w, x, y, z)
+                auto posesData = poses.mutable_unchecked<2>();
+                auto activeData = active.mutable_unchecked<1>();
+                for(py::ssize_t i = 0; i < activeData.shape(0); i++){
+                    activeData(i) = (size_t)i < actionPoseState.size() && actionPoseState[i].isActive;
+                    if(activeData(i)){
+                        const XrPosef & pose = actionPoseState[i].pose;
+                        posesData(i, 0) = pose.position.x;
+                        posesData(i, 1) = pose.position.y;
+                        posesData(i, 2) = pose.position.z;
+                        posesData(i, 3) = pose.orientation.w;
+                        posesData(i, 4) = pose.orientation.x;
+                        posesData(i, 5) = pose.orientation.y;
+                        posesData(i, 6) = pose.orientation.z;
+                    }
+                }
+                return returnValue;
+            }, py::arg("referenceSpaceType"), py::arg("poses").noconvert(), py::arg("active").noconvert())
         // render utilities
         .def("setRenderCallback", &OpenXrApplication::setRenderCallbackFromFunction)
+        .def("setRenderCallbackFromBuffers", [](OpenXrApplication &m, function<void(int, py::bytes, py::bytes)> callback){
+                // pass the views and configuration views as raw memory (C structures) instead of converting them to dictionaries
+                function<void(int, vector<XrView>, vector<XrViewConfigurationView>)> wrapper = [callback](int numViews, vector<XrView> views, vector<XrViewConfigurationView> configurationViews){
+                    callback(numViews, 
+                             py::bytes((const char *)views.data(), views.size() * sizeof(XrView)), 
+                             py::bytes((const char *)configurationViews.data(), configurationViews.size() * sizeof(XrViewConfigurationView)));
+                };
+                m.setRenderCallbackFromFunction(wrapper);
+            })
         .def("setFrames", [](OpenXrApplication &m, py::array_t<uint8_t> left, py::array_t<uint8_t> right, bool rgba){
                 py::buffer_info leftInfo = left.request();
                 if(m.getViewConfigurationViewsSize() == 1)
@@ -63,6 +63,7 @@ MAKE_TO_STRING_FUNC(XrFormFactor);
 struct ActionState{
   	XrActionType type;
 	const char * path;
+	int index;				// order in which the action was added
 	bool isActive;
     bool stateBool;			// XR_TYPE_ACTION_STATE_BOOLEAN
     float stateFloat;		// XR_TYPE_ACTION_STATE_FLOAT
@@ -73,6 +74,7 @@ struct ActionState{
 struct ActionPoseState{
   	XrActionType type;
 	const char * path;
+	int index;				// order in which the action was added
 	bool isActive;
 	XrPosef pose;			// XR_TYPE_ACTION_STATE_POSE
 };
@@ -81,6 +83,7 @@ struct Action{
 	XrAction action;
 	XrPath path;
  	string stringPath;
+	int index;
 };
 
 struct ActionPose{
@@ -89,6 +92,7 @@ struct ActionPose{
 	XrAction action;
 	XrPath path;
  	string stringPath;
+	int index;
 };
 
 struct Actions{
@@ -1868,6 +1872,7 @@ bool OpenXrApplication::pollActions(vector<ActionState> & actionStates){
 			ActionState state;
 			state.type = XR_ACTION_TYPE_BOOLEAN_INPUT;
 			state.path = xr_actions.aBoolean[i].stringPath.c_str();
+			state.index = xr_actions.aBoolean[i].index;
 			state.isActive = actionStateBoolean.isActive;
 			state.stateBool = (bool)actionStateBoolean.currentState;
 			actionStates.push_back(state);
@@ -1885,6 +1890,7 @@ bool OpenXrApplication::pollActions(vector<ActionState> & actionStates){
 			ActionState state;
 			state.type = XR_ACTION_TYPE_FLOAT_INPUT;
 			state.path = xr_actions.aFloat[i].stringPath.c_str();
+			state.index = xr_actions.aFloat[i].index;
 			state.isActive = actionStateFloat.isActive;
 			state.stateFloat = actionStateFloat.currentState;
 			actionStates.push_back(state);
@@ -1902,6 +1908,7 @@ bool OpenXrApplication::pollActions(vector<ActionState> & actionStates){
 			ActionState state;
 			state.type = XR_ACTION_TYPE_VECTOR2F_INPUT;
 			state.path = xr_actions.aVector2f[i].stringPath.c_str();
+			state.index = xr_actions.aVector2f[i].index;
 			state.isActive = actionStateVector2f.isActive;
 			state.stateVectorX = actionStateVector2f.currentState.x;
 			state.stateVectorY = actionStateVector2f.currentState.y;
@@ -1920,6 +1927,7 @@ bool OpenXrApplication::pollActions(vector<ActionState> & actionStates){
 			ActionState state;
 			state.type = XR_ACTION_TYPE_POSE_INPUT;
 			state.path = xr_actions.aPose[i].stringPath.c_str();
+			state.index = xr_actions.aPose[i].index;
 			state.isActive = actionStatePose.isActive;
 			actionStates.push_back(state);
 		}
@@ -1945,6 +1953,13 @@ bool OpenXrApplication::renderViews(XrReferenceSpaceType referenceSpaceType, vec
 	// locate actions
 	XrSpaceLocation spaceLocation = {XR_TYPE_SPACE_LOCATION};
 	for(size_t i = 0; i < xr_actions.aPose.size(); i++){
+		// one state per pose action (in the order they were added), inactive if it cannot be located
+		ActionPoseState state;
+		state.type = XR_ACTION_TYPE_POSE_INPUT;
+		state.path = xr_actions.aPose[i].stringPath.c_str();
+		state.index = xr_actions.aPose[i].index;
+		state.isActive = false;
+
 		XrSpace actionPoseSpace; 
 		if(xr_actions.aPose[i].referenceSpaceType == XR_REFERENCE_SPACE_TYPE_VIEW)
 			actionPoseSpace = xr_space_view;
@@ -1954,6 +1969,7 @@ bool OpenXrApplication::renderViews(XrReferenceSpaceType referenceSpaceType, vec
 			actionPoseSpace = xr_space_stage;
 		else{
 			std::cout << "[WARNING] Invalid reference space (" << xr_actions.aPose[i].referenceSpaceType << ") for " << xr_actions.aPose[i].stringPath << std::endl;
+			actionPoseStates.push_back(state);
 			continue;
 		}
 
@@ -1961,10 +1977,6 @@ bool OpenXrApplication::renderViews(XrReferenceSpaceType referenceSpaceType, vec
 		if(!xrCheckResult(xr_instance, xr_result, "xrLocateSpace"))
 			return false;
 		
-		ActionPoseState state;
-		state.type = XR_ACTION_TYPE_POSE_INPUT;
-		state.path = xr_actions.aPose[i].stringPath.c_str();
-		state.isActive = false;
 		if((spaceLocation.locationFlags & XR_VIEW_STATE_POSITION_VALID_BIT) != 0 || (spaceLocation.locationFlags & XR_VIEW_STATE_ORIENTATION_VALID_BIT) != 0){
 			state.isActive = true;
 			state.pose = spaceLocation.pose;
@@ -2123,12 +2135,16 @@ bool OpenXrApplication::addAction(string stringPath, XrActionType actionType, Xr
 	xr_result = xrCreateAction(xr_action_set, &actionInfo, &action);
 	if(!xrCheckResult(xr_instance, xr_result, "xrCreateAction"))
 		return false;
+
+	// actions are identified, regardless of their type, by the order in which they were added
+	int index = xr_actions.aBoolean.size() + xr_actions.aFloat.size() + xr_actions.aVector2f.size() + xr_actions.aPose.size() + xr_actions.aVibration.size();
 	
 	if(actionType == XR_ACTION_TYPE_BOOLEAN_INPUT){
 		Action actionPackage;
 		actionPackage.action = action; 
 		actionPackage.path = path; 
 		actionPackage.stringPath = stringPath;
+		actionPackage.index = index;
 		xr_actions.aBoolean.push_back(actionPackage);
 	}
 	else if(actionType == XR_ACTION_TYPE_FLOAT_INPUT){
@@ -2136,6 +2152,7 @@ bool OpenXrApplication::addAction(string stringPath, XrActionType actionType, Xr
 		actionPackage.action = action; 
 		actionPackage.path = path; 
 		actionPackage.stringPath = stringPath;
+		actionPackage.index = index;
 		xr_actions.aFloat.push_back(actionPackage);
 	}
 	else if(actionType == XR_ACTION_TYPE_VECTOR2F_INPUT){
@@ -2143,6 +2160,7 @@ bool OpenXrApplication::addAction(string stringPath, XrActionType actionType, Xr
 		actionPackage.action = action; 
 		actionPackage.path = path; 
 		actionPackage.stringPath = stringPath;
+		actionPackage.index = index;
 		xr_actions.aVector2f.push_back(actionPackage);
 	}
 	else if(actionType == XR_ACTION_TYPE_POSE_INPUT){
@@ -2150,6 +2168,7 @@ bool OpenXrApplication::addAction(string stringPath, XrActionType actionType, Xr
 		actionPackage.action = action; 
 		actionPackage.path = path; 
 		actionPackage.stringPath = stringPath;
+		actionPackage.index = index;
 		actionPackage.referenceSpaceType = referenceSpaceType;
 		xr_actions.aPose.push_back(actionPackage);
 	}
@@ -2158,6 +2177,7 @@ bool OpenXrApplication::addAction(string stringPath, XrActionType actionType, Xr
 		actionPackage.action = action; 
 		actionPackage.path = path; 
 		actionPackage.stringPath = stringPath;
+		actionPackage.index = index;
 		xr_actions.aVibration.push_back(actionPackage);
 	}
 	return true;